@@ -7,18 +7,38 @@ This is a bare-bones client designed to interact with audit related APIs only.
 """
 
 import logging
+import random
 import time
+from types import MappingProxyType
 from typing import Dict, Optional
 
 import jmespath
 import requests
+from requests.adapters import HTTPAdapter
 
 from grove.exceptions import RateLimitException, RequestFailedException
+from grove.helpers import parsing, ratelimit
 from grove.types import AuditLogEntries, HTTPResponse
 
 API_BASE_URI = "https://{identity}.{domain}/api/v1"
 API_PAGE_SIZE = 500
 
+# Headers common to all requests. These are read-only to ensure they cannot be modified
+# by any one client at runtime.
+API_HEADERS = MappingProxyType({"content-type": "application/json"})
+
+# Rate-limit retries are bounded, and backoff exponentially (with jitter) to avoid
+# retrying in lock-step with other clients sharing the same quota.
+API_RETRY_ATTEMPTS = 5
+API_RETRY_BACKOFF_BASE = 1.0
+API_RETRY_BACKOFF_CAP = 30.0
+API_RETRY_BACKOFF_JITTER = 0.5
+
+# Requests are paced client-side, adapting to rate-limits returned by Tines, to avoid
+# being throttled by the server in the first place.
+API_REQUEST_RATE = 1.0
+API_REQUEST_BURST = 5
+
 
 class Client:
     def __init__(
@@ -39,11 +59,76 @@ class Client:
         """
         self.retry = retry
         self.logger = logging.getLogger(__name__)
-        self.headers = {
-            "content-type": "application/json",
-            "x-user-token": token,
-        }
+
+        # Whether to retry on rate-limit is fixed for the lifetime of the client, so the
+        # handler is selected once here rather than on every rate-limited request.
+        self._handle_rate_limit = (
+            self._wait_rate_limit if retry else self._raise_rate_limit
+        )
+
+        self._bucket = ratelimit.TokenBucket(
+            rate=API_REQUEST_RATE,
+            capacity=API_REQUEST_BURST,
+        )
         self._api_base_uri = API_BASE_URI.format(identity=identity, domain=domain)
+        self._audit_logs_url = f"{self._api_base_uri}/audit_logs"
+
+        # Use a single session for all requests made by this client, in order to allow
+        # connections to be reused between pages rather than establishing a new TCP
+        # and TLS session for every request. Headers are set once on the session, rather
+        # than being passed - and merged - on every request.
+        self.session = requests.Session()
+        self.session.headers.update(API_HEADERS)
+        self.session.headers["x-user-token"] = token  # type: ignore
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=10),
+        )
+
+    def close(self):
+        """Closes the underlying HTTP session, and any pooled connections."""
+        self.session.close()
+
+    def _wait_rate_limit(self, err: requests.exceptions.RequestException, attempt: int):
+        """Waits before a rate-limited request is retried.
+
+        :param err: The exception raised for the rate-limited request.
+        :param attempt: The number of retries which have already been performed.
+
+        :raises RateLimitException: The maximum number of retries has been reached.
+        """
+        if attempt >= API_RETRY_ATTEMPTS:
+            raise RateLimitException(err)
+
+        time.sleep(self._backoff(err.response.headers.get("Retry-After"), attempt))
+
+    def _raise_rate_limit(
+        self, err: requests.exceptions.RequestException, attempt: int
+    ):
+        """Raises immediately for a rate-limited request, as retries are disabled.
+
+        :param err: The exception raised for the rate-limited request.
+        :param attempt: The number of retries which have already been performed.
+
+        :raises RateLimitException: A rate limit was encountered.
+        """
+        raise RateLimitException(err)
+
+    def _backoff(self, retry_after: Optional[str], attempt: int) -> float:
+        """Calculates how long to wait before retrying a rate-limited request.
+
+        The server provided Retry-After value is used as a floor, with an exponential
+        backoff - capped and with jitter applied - used otherwise.
+
+        :param retry_after: The Retry-After header value from the rate-limited response.
+        :param attempt: The number of retries which have already been performed.
+
+        :return: The number of seconds to wait before retrying.
+        """
+        backoff = min(API_RETRY_BACKOFF_CAP, API_RETRY_BACKOFF_BASE * 2**attempt)
+        delay = max(parsing.retry_after(retry_after, default=0.0), backoff)
+
+        return delay * (1 + random.random() * API_RETRY_BACKOFF_JITTER)  # noqa: S311
 
     def _get(
         self,
@@ -60,24 +145,25 @@ class Client:
 
         :return: HTTP Response object containing the headers and body of a response.
         """
+        attempt = 0
+
         while True:
+            self._bucket.acquire()
+
             try:
-                response = requests.get(
-                    url,
-                    headers=self.headers,  # type: ignore
-                    params=params,
-                )
+                response = self.session.get(url, params=params)
                 response.raise_for_status()
+                self._bucket.on_success()
                 break
             except requests.exceptions.RequestException as err:
-                # Retry on rate-limit, but only if requested.
+                # Retry on rate-limit, but only if requested, and only up to the maximum
+                # number of attempts. The request rate is always reduced, regardless.
                 if getattr(err.response, "status_code", None) == 429:
                     self.logger.warning("Rate-limit was exceeded during request")
-                    if self.retry:
-                        time.sleep(int(err.response.headers.get("Retry-After", "1")))
-                        continue
-                    else:
-                        raise RateLimitException(err)
+                    self._bucket.on_throttle()
+                    self._handle_rate_limit(err, attempt)
+                    attempt += 1
+                    continue
 
                 raise RequestFailedException(err)
 
@@ -94,21 +180,27 @@ class Client:
         :param after: An RFC3339 timestamp, without milliseconds, to collect logs after.
         :param operation_name: An optional operation to collect logs for.
         :param cursor: Cursor to use when fetching events (pagination). This is the
-            page number in the context of Tines.
+            URL of the next page, as returned by Tines in a previous response. As this
+            URL already encodes the original filters, 'after' and 'operation_name' are
+            ignored when a cursor is provided.
 
         :return: AuditLogEntries object containing a pagination cursor, and log entries.
         """
-        # See psf/requests issue #2651 for why we can happily pass in None values and
-        # not have the request key added to the URI.
-        result = self._get(
-            f"{self._api_base_uri}/audit_logs",
-            params={
-                "page": cursor,
-                "after": after,
-                "operation_name": operation_name,
-                "per_page": str(API_PAGE_SIZE),
-            },
-        )
+        # The next page URL returned by Tines already contains all query parameters,
+        # including filters, so it is requested as-is.
+        if cursor is not None:
+            result = self._get(cursor)
+        else:
+            # See psf/requests issue #2651 for why we can happily pass in None values
+            # and not have the request key added to the URI.
+            result = self._get(
+                self._audit_logs_url,
+                params={
+                    "after": after,
+                    "operation_name": operation_name,
+                    "per_page": str(API_PAGE_SIZE),
+                },
+            )
 
         # Return the cursor and the results to allow the caller to page as required.
         return AuditLogEntries(
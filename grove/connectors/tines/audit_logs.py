@@ -3,6 +3,7 @@
 
 """Tines Audit connector for Grove."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from grove.connectors import BaseConnector
@@ -10,6 +11,9 @@ from grove.connectors.tines.api import Client
 from grove.constants import OPERATION_DEFAULT, REVERSE_CHRONOLOGICAL
 from grove.exceptions import NotFoundException
 
+# The minimum number of log entries to batch together before saving.
+SAVE_BATCH_SIZE = 1000
+
 
 class Connector(BaseConnector):
     NAME = "tines_audit_logs"
@@ -46,7 +50,6 @@ class Connector(BaseConnector):
             domain=self.domain,
             identity=self.identity,
         )
-        cursor = None
 
         # If no pointer is stored then a previous run hasn't been performed, so set the
         # pointer to a week ago. The Tines API returns timestamps as RFC3339, and
@@ -68,18 +71,44 @@ class Connector(BaseConnector):
         if self.operation != OPERATION_DEFAULT:
             operation = self.operation
 
-        # Page over data using the cursor, saving returned data page by page.
-        while True:
-            log = client.list_audit_logs(
-                after=self.pointer,
-                cursor=cursor,
-                operation_name=operation,
-            )
-
-            # Save this batch of log entries.
-            self.save(log.entries)
-
-            # Check if we need to continue paging.
-            cursor = log.cursor
-            if cursor is None:
-                break
+        # Page over data using the cursor, saving returned data as it's collected. As
+        # both fetching and saving are I/O bound, the next page is requested in the
+        # background while the current batch is being saved. Only a single request is
+        # ever in flight to avoid additional pressure on rate-limits.
+        #
+        # The client is always closed once complete to release any pooled connections.
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                log = client.list_audit_logs(
+                    after=self.pointer,
+                    operation_name=operation,
+                )
+
+                entries = []
+
+                while True:
+                    prefetch = None
+                    if log.cursor is not None:
+                        prefetch = executor.submit(
+                            client.list_audit_logs,
+                            cursor=log.cursor,
+                        )
+
+                    # Log entries are batched across pages to reduce the number of
+                    # writes to the output, and are saved once the batch is full or
+                    # there are no more pages. Empty batches are never saved.
+                    entries.extend(log.entries)
+
+                    if entries and (
+                        prefetch is None or len(entries) >= SAVE_BATCH_SIZE
+                    ):
+                        self.save(entries)
+                        entries.clear()
+
+                    # Check if we need to continue paging.
+                    if prefetch is None:
+                        break
+
+                    log = prefetch.result()
+        finally:
+            client.close()
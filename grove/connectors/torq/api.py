@@ -110,10 +110,8 @@ class Client:
         auth_url = "https://auth.torq.io/v1/auth/token"
 
         # set basic auth value for authorisation header
-        basic_auth = str(
-            base64.b64encode(bytes(f"{self.identity}:{self.key}", "utf-8")),
-            "utf-8",
-        )
+        credentials = f"{self.identity}:{self.key}".encode()
+        basic_auth = base64.b64encode(credentials).decode("ascii")
 
         bearer_response = self._post(
             auth_url,
@@ -80,13 +80,12 @@ class Connector(BaseConnector):
 
         # If no pointer is stored then a previous run hasn't been performed, so set the
         # pointer to a week ago.
-        now = datetime.utcnow().strftime(DATESTAMP_FORMAT)
+        current = datetime.utcnow()
+        now = current.strftime(DATESTAMP_FORMAT)
         try:
             _ = self.pointer
         except NotFoundException:
-            self.pointer = (datetime.utcnow() - timedelta(days=7)).strftime(
-                DATESTAMP_FORMAT
-            )
+            self.pointer = (current - timedelta(days=7)).strftime(DATESTAMP_FORMAT)
 
         # Get log data from the upstream API. A "from" and "to" datetime query
         # parameters are required.
@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional
 import requests
 
 from grove.exceptions import RateLimitException, RequestFailedException
+from grove.helpers import parsing
 from grove.types import AuditLogEntries, HTTPResponse
 
 API_BASE_URI = "https://{base_url}/ccx/api/privacy/v1/{identity}"
@@ -77,7 +78,9 @@ class Client:
                 if getattr(err.response, "status_code", None) == 429:
                     self.logger.warning("Rate-limit was exceeded during request")
                     if self.retry:
-                        time.sleep(int(err.response.headers.get("Retry-After", "1")))
+                        time.sleep(
+                            parsing.retry_after(err.response.headers.get("Retry-After"))
+                        )
                         continue
                     else:
                         raise RateLimitException(err)
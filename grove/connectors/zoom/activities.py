@@ -45,13 +45,12 @@ class Connector(BaseConnector):
         # If no pointer is stored then a previous run hasn't been performed, so set the
         # pointer to a day ago. This API uses a YYYYMMDD date range. We can input using
         # RFC 3339 format because the API converts the to and from to YYYYMMDD.
-        now = datetime.utcnow().strftime(DATESTAMP_FORMAT)
+        current = datetime.utcnow()
+        now = current.strftime(DATESTAMP_FORMAT)
         try:
             _ = self.pointer
         except NotFoundException:
-            self.pointer = (datetime.utcnow() - timedelta(days=1)).strftime(
-                DATESTAMP_FORMAT
-            )
+            self.pointer = (current - timedelta(days=1)).strftime(DATESTAMP_FORMAT)
 
         # Get log data from the upstream API. "From" and "to" datetime query parameters
         # are required. This API only gets data from a YYYYMMDD date range.
@@ -15,6 +15,7 @@ from typing import Any, Dict, Optional
 import requests
 
 from grove.exceptions import RateLimitException, RequestFailedException
+from grove.helpers import parsing
 from grove.types import AuditLogEntries, HTTPResponse
 
 API_BASE_URI = "https://api.zoom.us"
@@ -71,7 +72,9 @@ class Client:
                 if err.response.status_code == 429:
                     self.logger.warning("Rate-limit was exceeded during request")
                     if self.retry:
-                        time.sleep(int(err.response.headers.get("Retry-After", "1")))
+                        time.sleep(
+                            parsing.retry_after(err.response.headers.get("Retry-After"))
+                        )
                         continue
                     else:
                         raise RateLimitException(err) from err
@@ -118,10 +121,8 @@ class Client:
         url = f"https://zoom.us/oauth/token?grant_type={grant_type}&account_id={self.identity}"
 
         # set basic auth value for authorization header
-        basic_auth = str(
-            base64.b64encode(bytes(f"{self.client_id}:{self.key}", "utf-8")),
-            "utf-8",
-        )
+        credentials = f"{self.client_id}:{self.key}".encode()
+        basic_auth = base64.b64encode(credentials).decode("ascii")
 
         bearer_response = self._post(
             url,
@@ -3,4 +3,4 @@
 
 """Grove helpers."""
 
-from grove.helpers import parsing, plugin  # noqa: F401
+from grove.helpers import parsing, plugin, ratelimit  # noqa: F401
@@ -5,7 +5,9 @@
 
 import json
 import re
-from typing import Any, Dict, List
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
 
 from pydantic import ValidationError
 
@@ -73,6 +75,38 @@ def quote_aware_split(value: str, delimiter=".") -> List[str]:
     return fields
 
 
+def retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parse the value of a Retry-After HTTP header into a number of seconds.
+
+    The Retry-After header may be expressed as either a number of seconds, or as an
+    HTTP-date (RFC 7231). Both are supported, with fractional seconds preserved. Dates
+    in the past result in no delay.
+
+    :param value: The value of the Retry-After header.
+    :param default: The number of seconds to return if the value is missing or invalid.
+
+    :return: The number of seconds to wait before retrying.
+    """
+    if not value:
+        return default
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+
+    # Dates without timezone information are assumed to be UTC, per RFC 7231.
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def update_path(
     candidate: Dict[str, Any],
     path: List[str],
@@ -0,0 +1,81 @@
+# Copyright (c) HashiCorp, Inc.
+# SPDX-License-Identifier: MPL-2.0
+
+"""Provides helpers for client-side rate-limiting."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float = 1.0,
+        capacity: int = 5,
+        min_rate: float = 0.1,
+        max_rate: float = 10.0,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ):
+        """Setup a new adaptive token bucket, used to pace outgoing requests.
+
+        Tokens are added to the bucket at the current rate, up to the capacity of the
+        bucket. The rate adapts using additive-increase / multiplicative-decrease
+        (AIMD): the rate is slowly increased on every successful request, and quickly
+        reduced whenever a request is throttled by the remote server.
+
+        :param rate: The initial number of tokens added to the bucket per second.
+        :param capacity: The maximum number of tokens which the bucket may hold, and
+            therefore the maximum number of requests which can be made in a burst.
+        :param min_rate: The lowest rate the bucket may be reduced to.
+        :param max_rate: The highest rate the bucket may be increased to.
+        :param increase: The amount to increase the rate by on success.
+        :param decrease: The factor to multiply the rate by when throttled.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        """Adds tokens to the bucket based on the time since the last refill."""
+        now = time.monotonic()
+
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+        self._updated = now
+
+    def acquire(self):
+        """Takes a token from the bucket, blocking until one is available.
+
+        The token is reserved before waiting, allowing the bucket to go into debt. This
+        ensures that concurrent callers queue fairly, without needing to poll.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self):
+        """Additively increases the rate after a successful request."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self):
+        """Multiplicatively decreases the rate, and drains the bucket, on throttle."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
@@ -6,11 +6,13 @@
 import os
 import re
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import responses
 
+from grove.connectors.tines import api
 from grove.connectors.tines.audit_logs import Connector
+from grove.exceptions import RateLimitException
 from grove.models import ConnectorConfig
 from tests import mocks
 
@@ -70,6 +72,15 @@ class TinesAuditTestCase(unittest.TestCase):
         self.assertEqual(self.connector._saved["logs"], 2)
         self.assertEqual(self.connector.pointer, "2023-07-21T14:21:30Z")
 
+        # Ensure that both pages were batched together into a single save.
+        self.assertEqual(self.connector._part, 1)
+
+        # Ensure the next page URL returned by Tines is requested as-is.
+        self.assertEqual(
+            responses.calls[1].request.url,
+            "https://my-tenant.tines.com/api/v1/audit_logs?per_page=1&page=2",
+        )
+
     @responses.activate
     def test_collect_no_pagination(self):
         """Ensure collection without pagination is working as expected."""
@@ -89,3 +100,191 @@ class TinesAuditTestCase(unittest.TestCase):
         self.connector.run()
         self.assertEqual(self.connector._saved["logs"], 2)
         self.assertEqual(self.connector.pointer, "2023-07-21T10:32:37Z")
+
+    @responses.activate
+    def test_collect_rate_limit(self):
+        """Ensure rate-limit retries are working as expected."""
+        # Rate limit the first request.
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=429,
+            content_type="application/json",
+            body=bytes(),
+        )
+
+        # Succeed on the second.
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=200,
+            content_type="application/json",
+            body=bytes(
+                open(
+                    os.path.join(self.dir, "fixtures/tines/audit_logs/003.json"), "r"
+                ).read(),
+                "utf-8",
+            ),
+        )
+
+        # Ensure the request is retried once in response to a rate-limit, and that the
+        # collection then completes.
+        with patch("time.sleep", return_value=None) as mock_sleep:
+            self.connector.run()
+            mock_sleep.assert_called()
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(self.connector._saved["logs"], 2)
+
+    @responses.activate
+    def test_collect_rate_limit_exhausted(self):
+        """Ensure rate-limit retries are bounded."""
+        # Rate limit every request.
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=429,
+            content_type="application/json",
+            body=bytes(),
+        )
+
+        with patch("time.sleep", return_value=None):
+            self.connector.run()
+
+        self.assertEqual(len(responses.calls), api.API_RETRY_ATTEMPTS + 1)
+
+        self.assertEqual(self.connector._saved["logs"], 0)
+
+    @responses.activate
+    def test_client_rate_limit_no_retry(self):
+        """Ensure rate-limits are raised immediately if retries are disabled."""
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=429,
+            content_type="application/json",
+            body=bytes(),
+        )
+
+        client = api.Client(identity="1FEEDFEED1", token="token", retry=False)
+
+        with patch("time.sleep", return_value=None) as mock_sleep:
+            with self.assertRaises(RateLimitException):
+                client.list_audit_logs()
+
+            mock_sleep.assert_not_called()
+
+    @responses.activate
+    def test_collect_no_entries(self):
+        """Ensure save is not called when no log entries are returned."""
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=200,
+            content_type="application/json",
+            json={"audit_logs": [], "meta": {"next_page": None}},
+        )
+
+        with patch.object(self.connector, "save") as mock_save:
+            self.connector.run()
+            mock_save.assert_not_called()
+
+    def test_client_backoff(self):
+        """Ensure rate-limit backoff delays are calculated as expected."""
+        client = api.Client(identity="1FEEDFEED1", token="token")
+
+        # Use the maximum jitter to make the results deterministic.
+        with patch("random.random", return_value=1.0):
+            jitter = 1 + api.API_RETRY_BACKOFF_JITTER
+
+            # A large Retry-After is used as a floor.
+            self.assertEqual(client._backoff("60", 0), 60 * jitter)
+
+            # The exponential backoff is capped.
+            self.assertEqual(
+                client._backoff(None, 10), api.API_RETRY_BACKOFF_CAP * jitter
+            )
+
+            # Without Retry-After, the exponential backoff is used.
+            self.assertEqual(
+                client._backoff(None, 2), api.API_RETRY_BACKOFF_BASE * 2**2 * jitter
+            )
+
+    @responses.activate
+    def test_client_pacing(self):
+        """Ensure requests are paced, and the rate adapted, by the client."""
+        # Rate limit the first request, and succeed on the second.
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=429,
+            content_type="application/json",
+            body=bytes(),
+        )
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=200,
+            content_type="application/json",
+            body=bytes(
+                open(
+                    os.path.join(self.dir, "fixtures/tines/audit_logs/003.json"), "r"
+                ).read(),
+                "utf-8",
+            ),
+        )
+
+        client = api.Client(identity="1FEEDFEED1", token="token")
+
+        with patch("time.sleep", return_value=None):
+            with patch.object(client, "_bucket") as mock_bucket:
+                client.list_audit_logs()
+
+        # A token must be acquired before every request, with the rate reduced on
+        # rate-limit and increased on success.
+        self.assertEqual(
+            mock_bucket.mock_calls,
+            [
+                call.acquire(),
+                call.on_throttle(),
+                call.acquire(),
+                call.on_success(),
+            ],
+        )
+
+    @responses.activate
+    def test_collect_prefetch_failure(self):
+        """Ensure a failure fetching the next page in the background is handled."""
+        # Succeed with a cursor returned, but fail when fetching the next page.
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=200,
+            content_type="application/json",
+            body=bytes(
+                open(
+                    os.path.join(self.dir, "fixtures/tines/audit_logs/001.json"), "r"
+                ).read(),
+                "utf-8",
+            ),
+        )
+        responses.add(
+            responses.GET,
+            re.compile(r"https://.*"),
+            status=500,
+            content_type="application/json",
+            body=bytes(),
+        )
+
+        with patch.object(api.Client, "close") as mock_close:
+            with patch.object(self.connector, "save") as mock_save:
+                with self.assertLogs("grove.connectors", level="ERROR"):
+                    self.connector.run()
+
+            # The client must always be closed, even on failure.
+            mock_close.assert_called_once()
+
+        # The first page is smaller than a batch so is held until the next page, which
+        # failed, meaning nothing is saved.
+        self.assertEqual(len(responses.calls), 2)
+        mock_save.assert_not_called()
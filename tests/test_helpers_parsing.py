@@ -4,6 +4,8 @@
 """Implements tests for parsing helpers."""
 
 import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 
 from grove.helpers import parsing
 
@@ -85,3 +87,24 @@ class ParsingHelpersTestCase(unittest.TestCase):
                 None,
             ),
         )
+
+    def test_retry_after(self):
+        """Ensures Retry-After header values are parsed as expected."""
+        # Delay in seconds, including fractional seconds.
+        self.assertEqual(parsing.retry_after("5"), 5.0)
+        self.assertEqual(parsing.retry_after("0.25"), 0.25)
+
+        # Missing or invalid values fall back to the default.
+        self.assertEqual(parsing.retry_after(None), 1.0)
+        self.assertEqual(parsing.retry_after("soon"), 1.0)
+        self.assertEqual(parsing.retry_after("", default=0.0), 0.0)
+
+        # HTTP-dates are converted into a delay from now, with dates in the past
+        # resulting in no delay.
+        later = datetime.now(timezone.utc) + timedelta(seconds=30)
+        self.assertAlmostEqual(
+            parsing.retry_after(format_datetime(later, usegmt=True)), 30, delta=2
+        )
+
+        earlier = datetime.now(timezone.utc) - timedelta(seconds=30)
+        self.assertEqual(parsing.retry_after(format_datetime(earlier, usegmt=True)), 0)
@@ -0,0 +1,62 @@
+# Copyright (c) HashiCorp, Inc.
+# SPDX-License-Identifier: MPL-2.0
+
+"""Implements tests for rate-limiting helpers."""
+
+import unittest
+from unittest.mock import patch
+
+from grove.helpers.ratelimit import TokenBucket
+
+
+class TokenBucketTestCase(unittest.TestCase):
+    """Implements tests for the adaptive token bucket."""
+
+    def test_acquire(self):
+        """Ensures requests are only paced once the bucket is empty."""
+        bucket = TokenBucket(rate=2.0, capacity=3)
+
+        with patch("time.sleep", return_value=None) as mock_sleep:
+            # The initial burst should not wait.
+            for _ in range(3):
+                bucket.acquire()
+
+            mock_sleep.assert_not_called()
+
+            # The next request should wait for roughly one token to be added.
+            bucket.acquire()
+            mock_sleep.assert_called_once()
+            self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.5, delta=0.05)
+
+    def test_adaptive_rate(self):
+        """Ensures the rate is adjusted on success and throttling, within limits."""
+        bucket = TokenBucket(
+            rate=1.0,
+            min_rate=0.25,
+            max_rate=1.5,
+            increase=0.25,
+            decrease=0.5,
+        )
+
+        # Multiplicative decrease, down to the minimum rate.
+        bucket.on_throttle()
+        self.assertEqual(bucket.rate, 0.5)
+        bucket.on_throttle()
+        bucket.on_throttle()
+        self.assertEqual(bucket.rate, 0.25)
+
+        # Additive increase, up to the maximum rate.
+        bucket.on_success()
+        self.assertEqual(bucket.rate, 0.5)
+        for _ in range(10):
+            bucket.on_success()
+        self.assertEqual(bucket.rate, 1.5)
+
+    def test_throttle_drains_bucket(self):
+        """Ensures no further burst is permitted after being throttled."""
+        bucket = TokenBucket(rate=1.0, capacity=5)
+        bucket.on_throttle()
+
+        with patch("time.sleep", return_value=None) as mock_sleep:
+            bucket.acquire()
+            mock_sleep.assert_called_once()